@@ -0,0 +1,120 @@
+/* C kernel for the LPT scheduling loop.
+ *
+ * Exposes lpt_schedule(sorted_jobs, processors) where sorted_jobs is any
+ * C-contiguous buffer of int64 job lengths in descending order (a NumPy
+ * int64 array or an array.array('q')). Returns (assign, loads) as plain
+ * lists: one processor id per job and the final per-processor loads.
+ *
+ * The inner loop is the same first-come-first-serve argmin scan as the
+ * Python kernels; compiled with -O3 it runs a handful of instructions
+ * per processor and auto-vectorizes for larger processor counts.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+#include <stdlib.h>
+
+static PyObject *
+lpt_schedule(PyObject *self, PyObject *args)
+{
+    Py_buffer jobs;
+    int processors;
+    Py_ssize_t n, i;
+    const int64_t *sorted_jobs;
+    int64_t *loads = NULL;
+    int *assign = NULL;
+    PyObject *assign_list = NULL;
+    PyObject *loads_list = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*i:lpt_schedule", &jobs, &processors))
+        return NULL;
+
+    if (processors <= 0) {
+        PyErr_SetString(PyExc_ValueError, "processors must be positive");
+        goto error;
+    }
+    if (jobs.len % (Py_ssize_t)sizeof(int64_t) != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "jobs buffer length is not a multiple of 8 bytes");
+        goto error;
+    }
+
+    n = jobs.len / (Py_ssize_t)sizeof(int64_t);
+    sorted_jobs = (const int64_t *)jobs.buf;
+
+    loads = calloc((size_t)processors, sizeof(int64_t));
+    assign = malloc((size_t)(n > 0 ? n : 1) * sizeof(int));
+    if (loads == NULL || assign == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    for (i = 0; i < n; i++) {
+        int proc = 0;
+        int k;
+        int64_t minload = loads[0];
+        for (k = 1; k < processors; k++) {
+            if (loads[k] < minload) {
+                minload = loads[k];
+                proc = k;
+            }
+        }
+        assign[i] = proc;
+        loads[proc] += sorted_jobs[i];
+    }
+
+    assign_list = PyList_New(n);
+    if (assign_list == NULL)
+        goto error;
+    for (i = 0; i < n; i++) {
+        PyObject *item = PyLong_FromLong(assign[i]);
+        if (item == NULL)
+            goto error;
+        PyList_SET_ITEM(assign_list, i, item);
+    }
+
+    loads_list = PyList_New(processors);
+    if (loads_list == NULL)
+        goto error;
+    for (i = 0; i < processors; i++) {
+        PyObject *item = PyLong_FromLongLong(loads[i]);
+        if (item == NULL)
+            goto error;
+        PyList_SET_ITEM(loads_list, i, item);
+    }
+
+    free(loads);
+    free(assign);
+    PyBuffer_Release(&jobs);
+    return Py_BuildValue("(NN)", assign_list, loads_list);
+
+error:
+    Py_XDECREF(assign_list);
+    Py_XDECREF(loads_list);
+    free(loads);
+    free(assign);
+    PyBuffer_Release(&jobs);
+    return NULL;
+}
+
+static PyMethodDef lpt_core_methods[] = {
+    {"lpt_schedule", lpt_schedule, METH_VARARGS,
+     "lpt_schedule(sorted_jobs, processors) -> (assign, loads)\n\n"
+     "Schedule descending int64 jobs onto the least-loaded processor."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef lpt_core_module = {
+    PyModuleDef_HEAD_INIT,
+    "lpt_core",
+    "C kernel for the LPT scheduling loop.",
+    -1,
+    lpt_core_methods
+};
+
+PyMODINIT_FUNC
+PyInit_lpt_core(void)
+{
+    return PyModule_Create(&lpt_core_module);
+}
@@ -12,9 +12,15 @@ Advantages:
 Bottleneck and Dependency:
 1. The upper bound of processors is dependent on largest task by time
 """
-import pprint
-from lpt import LPT
-from math import ceil
+import io
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from lpt import LPT, format_rows
 
 
 DELIMITER1 = '\n' + '*' * 50 + '\n'
@@ -24,10 +30,19 @@ DELIMITER2 = '-' * 50 + '\n'
 class OptimizedLPT(object):
     """Implementation of Optimized LPT algorithm (Longest Processing Time)."""
 
-    def __init__(self, jobs, processors):
-        """Initializing with J Jobs, M Processors, N Optimal Processors."""
+    __slots__ = ('jobs', 'processors', '_jobs_arr', '_presorted')
+
+    def __init__(self, jobs, processors, _presorted=None):
+        """Initializing with J Jobs, M Processors, N Optimal Processors.
+
+        _presorted is forwarded to LPT so a sweep over several
+        processor counts only sorts the jobs once.
+        """
         self.jobs = jobs
         self.processors = processors
+        self._presorted = _presorted
+        self._jobs_arr = None if np is None else np.asarray(jobs,
+                                                            dtype=np.int64)
 
     def _get_optimal_processors(self):
         """Find the Optimal Number of Processors required for Jobs.
@@ -40,9 +55,15 @@ class OptimizedLPT(object):
                         of processors, use the current number of processors.
                         Else, use the ideal number of processors are optimal.
         """
-        maxjob = float(max(self.jobs))
-        total = float(sum(self.jobs))
-        ideal = int(ceil(total / maxjob))
+        if self._jobs_arr is not None:
+            maxjob = int(self._jobs_arr.max())
+            total = int(self._jobs_arr.sum())
+        else:
+            maxjob = max(self.jobs)
+            total = sum(self.jobs)
+        # Integer ceiling division: exact for any job total, unlike the
+        # former float division + math.ceil.
+        ideal = (total + maxjob - 1) // maxjob
 
         if ideal < self.processors:
             return ideal
@@ -52,7 +73,8 @@ class OptimizedLPT(object):
     def run(self):
         """Run the Optimized LPT Algorithm."""
         optimal_processors = self._get_optimal_processors()
-        lpt = LPT(self.jobs, optimal_processors)
+        lpt = LPT(self.jobs, optimal_processors,
+                  _presorted=self._presorted)
         scheduled_jobs, loads = lpt.run()
 
         diff = self.processors - optimal_processors
@@ -68,19 +90,22 @@ def test_lpt_zero():
     jobs = [3, 1, 6, 4, 5, 2]
     processors = [2, 4, 6, 8]
 
-    print DELIMITER1
-    print "Jobs: {}".format(pprint.pformat(jobs))
+    buf = io.StringIO()
+    buf.write(DELIMITER1 + '\n')
+    buf.write("Jobs: [{}]\n".format(', '.join(map(str, jobs))))
 
+    presorted = sorted(jobs, reverse=True)
     for processor in processors:
-        print DELIMITER2
-        print "Processor: {}".format(processor)
-        opt_lpt = OptimizedLPT(jobs, processor)
+        buf.write(DELIMITER2 + '\n')
+        buf.write("Processor: {}\n".format(processor))
+        opt_lpt = OptimizedLPT(jobs, processor, _presorted=presorted)
         scheduled_jobs, loads = opt_lpt.run()
-        print "Scheduled Jobs: {}".format(pprint.pformat(scheduled_jobs))
-        print "Loads: {}".format(pprint.pformat(loads))
-        print DELIMITER2
+        buf.write("Scheduled Jobs: {}\n".format(format_rows(scheduled_jobs)))
+        buf.write("Loads: [{}]\n".format(', '.join(map(str, loads))))
+        buf.write(DELIMITER2 + '\n')
 
-    print DELIMITER1
+    buf.write(DELIMITER1 + '\n')
+    sys.stdout.write(buf.getvalue())
 
 
 def test_lpt_one():
@@ -89,19 +114,22 @@ def test_lpt_one():
             12, 11, 10, 8, 6, 3]
     processors = [2, 4, 6, 8]
 
-    print DELIMITER1
-    print "Jobs: {}".format(pprint.pformat(jobs))
+    buf = io.StringIO()
+    buf.write(DELIMITER1 + '\n')
+    buf.write("Jobs: [{}]\n".format(', '.join(map(str, jobs))))
 
+    presorted = sorted(jobs, reverse=True)
     for processor in processors:
-        print DELIMITER2
-        print "Processor: {}".format(processor)
-        opt_lpt = OptimizedLPT(jobs, processor)
+        buf.write(DELIMITER2 + '\n')
+        buf.write("Processor: {}\n".format(processor))
+        opt_lpt = OptimizedLPT(jobs, processor, _presorted=presorted)
         scheduled_jobs, loads = opt_lpt.run()
-        print "Scheduled Jobs: {}".format(pprint.pformat(scheduled_jobs))
-        print "Loads: {}".format(pprint.pformat(loads))
-        print DELIMITER2
+        buf.write("Scheduled Jobs: {}\n".format(format_rows(scheduled_jobs)))
+        buf.write("Loads: [{}]\n".format(', '.join(map(str, loads))))
+        buf.write(DELIMITER2 + '\n')
 
-    print DELIMITER1
+    buf.write(DELIMITER1 + '\n')
+    sys.stdout.write(buf.getvalue())
 
 
 def test_lpt_two():
@@ -114,19 +142,22 @@ def test_lpt_two():
             127, 300, 9, 7, 9, 8]
     processors = [2, 4, 6, 8]
 
-    print DELIMITER1
-    print "Jobs: {}".format(pprint.pformat(jobs))
+    buf = io.StringIO()
+    buf.write(DELIMITER1 + '\n')
+    buf.write("Jobs: [{}]\n".format(', '.join(map(str, jobs))))
 
+    presorted = sorted(jobs, reverse=True)
     for processor in processors:
-        print DELIMITER2
-        print "Processor: {}".format(processor)
-        opt_lpt = OptimizedLPT(jobs, processor)
+        buf.write(DELIMITER2 + '\n')
+        buf.write("Processor: {}\n".format(processor))
+        opt_lpt = OptimizedLPT(jobs, processor, _presorted=presorted)
         scheduled_jobs, loads = opt_lpt.run()
-        print "Scheduled Jobs: {}".format(pprint.pformat(scheduled_jobs))
-        print "Loads: {}".format(pprint.pformat(loads))
-        print DELIMITER2
+        buf.write("Scheduled Jobs: {}\n".format(format_rows(scheduled_jobs)))
+        buf.write("Loads: [{}]\n".format(', '.join(map(str, loads))))
+        buf.write(DELIMITER2 + '\n')
 
-    print DELIMITER1
+    buf.write(DELIMITER1 + '\n')
+    sys.stdout.write(buf.getvalue())
 
 
 def test_lpt_three():
@@ -149,16 +180,19 @@ def test_lpt_three():
             102, 300, 13, 1, 13, 17, 8, 13, 10, 300, 7, 12, 52]
     processors = [2, 4, 6, 8]
 
-    print DELIMITER1
-    print "Jobs: {}".format(pprint.pformat(jobs))
+    buf = io.StringIO()
+    buf.write(DELIMITER1 + '\n')
+    buf.write("Jobs: [{}]\n".format(', '.join(map(str, jobs))))
 
+    presorted = sorted(jobs, reverse=True)
     for processor in processors:
-        print DELIMITER2
-        print "Processor: {}".format(processor)
-        opt_lpt = OptimizedLPT(jobs, processor)
+        buf.write(DELIMITER2 + '\n')
+        buf.write("Processor: {}\n".format(processor))
+        opt_lpt = OptimizedLPT(jobs, processor, _presorted=presorted)
         scheduled_jobs, loads = opt_lpt.run()
-        print "Scheduled Jobs: {}".format(pprint.pformat(scheduled_jobs))
-        print "Loads: {}".format(pprint.pformat(loads))
-        print DELIMITER2
+        buf.write("Scheduled Jobs: {}\n".format(format_rows(scheduled_jobs)))
+        buf.write("Loads: [{}]\n".format(', '.join(map(str, loads))))
+        buf.write(DELIMITER2 + '\n')
 
-    print DELIMITER1
+    buf.write(DELIMITER1 + '\n')
+    sys.stdout.write(buf.getvalue())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+"""Build script for the optional lpt_core C extension.
+
+The pure-Python modules work without it; when the extension is built
+(python setup.py build_ext --inplace) lpt.py picks it up automatically
+as its fastest scheduling kernel.
+"""
+from setuptools import Extension, setup
+
+setup(
+    name='lpt',
+    version='1.0',
+    description='LPT and Optimized LPT multiprocessor scheduling',
+    py_modules=['lpt', 'optimized_lpt'],
+    ext_modules=[
+        Extension(
+            'lpt_core',
+            sources=['lpt_core.c'],
+            extra_compile_args=['-O3', '-march=native'],
+            optional=True,
+        ),
+    ],
+)